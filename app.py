@@ -2,12 +2,17 @@ from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 import re
 import json
+import gzip
 from collections import Counter
 import math
 
 app = Flask(__name__)
 CORS(app)
 
+# Responses smaller than this are sent as-is; gzip overhead outweighs the savings
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+
 class ResumeAnalyzer:
     def __init__(self):
         self.skill_keywords = {
@@ -596,6 +601,27 @@ class ResumeAnalyzer:
 
 analyzer = ResumeAnalyzer()
 
+@app.after_request
+def compress_response(response):
+    """Gzip JSON responses when the client accepts it and the body is large enough"""
+    if response.mimetype != 'application/json' or response.direct_passthrough or response.is_streamed:
+        return response
+
+    response.vary.add('Accept-Encoding')
+
+    if 'Content-Encoding' in response.headers:
+        return response
+    if not request.accept_encodings['gzip']:
+        return response
+
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 @app.route('/')
 def index():
     return render_template('index.html')